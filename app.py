@@ -1,16 +1,55 @@
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import copy
 import datetime
+import functools
+import heapq
 import html
+import itertools
 import json
+import logging
+import operator
+import os
 import re
+import sqlite3
+import string
+import tempfile
+import threading
+import time
 import urllib.parse
-import urllib.request
 
+import requests
 import streamlit as st
 import yt_dlp
 try:
-    from youtube_transcript_api import YouTubeTranscriptApi
+    from youtube_transcript_api import (
+        IpBlocked,
+        NoTranscriptFound,
+        RequestBlocked,
+        TranscriptsDisabled,
+        YouTubeTranscriptApi,
+    )
 except ImportError:
     YouTubeTranscriptApi = None
+    # Empty tuples match nothing in isinstance() checks and except clauses.
+    IpBlocked = NoTranscriptFound = RequestBlocked = TranscriptsDisabled = ()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(value):
+        return json.dumps(value).encode("utf-8")
+
+_logger = logging.getLogger(__name__)
 
 # --- PAGE CONFIG (Must be first) ---
 st.set_page_config(page_title="Executive Tracker", page_icon=":bar_chart:", layout="wide")
@@ -20,6 +59,42 @@ GEM_URL = "https://gemini.google.com/gem/1HTDzIGbVXIA7dJodfgK3jahP3sayuWWl?usp=s
 MAX_VIDEOS_PER_CHANNEL = 5
 PREFERRED_LANGUAGES = ["pt-BR", "pt", "en", "en-US"]
 REQUEST_TIMEOUT_SECONDS = 15
+CONNECT_TIMEOUT_SECONDS = 3
+MAX_FETCH_WORKERS = 8
+TRANSCRIPT_BULK_WORKERS = 8
+DISK_CACHE_PATH = os.path.join(tempfile.gettempdir(), "tracker_cache.sqlite3")
+YTDLP_CACHE_DIR = os.path.expanduser("~/.cache/tracker-dashboard/ytdlp")
+TRANSCRIPT_CACHE_TTL_SECONDS = 86400
+FAILED_TRANSCRIPT_CACHE_TTL_SECONDS = 3600
+RATE_LIMIT_ATTEMPTS = 3
+RATE_LIMIT_BACKOFF_SECONDS = 1
+RATE_LIMIT_MAX_BACKOFF_SECONDS = 10
+TRANSCRIPT_REQUESTS_PER_MINUTE = 6
+TRANSCRIPT_REQUEST_BURST = 5
+CHANNEL_CACHE_TTL_SECONDS = 1800
+STALE_CHANNEL_RETRY_SECONDS = 300
+STALE_CHANNEL_GRACE_SECONDS = 7 * 86400
+
+_PREFERRED_LANGUAGES_LOWER = [language.lower() for language in PREFERRED_LANGUAGES]
+_PREFERRED_LANGUAGE_PREFIXES = [language.split("-")[0] for language in _PREFERRED_LANGUAGES_LOWER]
+_RE_VIDEO_URL = re.compile(
+    r"(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/(?:watch\?v=|shorts/|embed/|live/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+_RE_WORD = re.compile(r"[A-Za-zÀ-ÿ0-9']+")
+_RE_WS = re.compile(r"\s+")
+_RE_SENT = re.compile(r"(?<=[.!?])\s+")
+_RE_MARKUP_TAG = re.compile(r"<[^>\n]*>")
+_VTT_HEADER_PREFIXES = ("WEBVTT", "Kind:", "Language:")
+# Formats whose text escapes literal brackets, so anything in <...> is markup. SRT does not.
+_TAGGED_CAPTION_EXTS = ("vtt", "ttml", "srv")
+
+_SUMMARY_DEDUPE_PREFIX = 64
+_STOP_WORDS = frozenset({
+    "the", "and", "that", "this", "with", "from", "have", "were", "what", "about", "would", "there",
+    "para", "com", "uma", "que", "por", "isso", "como", "mais", "muito", "sobre", "entre", "tambem",
+})
 
 CATEGORIES = {
     "Tech": [
@@ -70,28 +145,96 @@ st.markdown(
 )
 
 
+def _disk_cache_connect():
+    conn = sqlite3.connect(DISK_CACHE_PATH, timeout=REQUEST_TIMEOUT_SECONDS)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires_at REAL, value BLOB)")
+    return conn
+
+
+def _disk_cache_row(key):
+    try:
+        with contextlib.closing(_disk_cache_connect()) as conn:
+            return conn.execute("SELECT expires_at, value FROM cache WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+
+
+def _disk_cache_get(key):
+    row = _disk_cache_row(key)
+    if not row or row[0] < time.time():
+        return None
+    return _json_loads(row[1])
+
+
+def _disk_cache_get_stale(key):
+    row = _disk_cache_row(key)
+    if not row:
+        return None, False
+    return _json_loads(row[1]), row[0] < time.time()
+
+
+def _disk_cache_set(key, value, ttl_seconds):
+    now = time.time()
+    try:
+        with contextlib.closing(_disk_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, now + ttl_seconds, _json_dumps(value)),
+            )
+            # Expired channel listings are still served while they refresh, so they get a grace period.
+            conn.execute(
+                "DELETE FROM cache WHERE expires_at < ? AND (key NOT LIKE 'ch:%' OR expires_at < ?)",
+                (now, now - STALE_CHANNEL_GRACE_SECONDS),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _disk_cache_clear():
+    try:
+        with contextlib.closing(_disk_cache_connect()) as conn, conn:
+            conn.execute("DELETE FROM cache")
+    except sqlite3.Error:
+        pass
+
+
+def clear_caches():
+    st.cache_data.clear()
+    _disk_cache_clear()
+    st.session_state.pop("selected_transcript", None)
+
+
+def _is_video_id(candidate):
+    return candidate is not None and len(candidate) == 11 and _VIDEO_ID_CHARS.issuperset(candidate)
+
+
 def extract_video_id(video_url_or_id):
     if not video_url_or_id:
         return None
-    if re.fullmatch(r"[A-Za-z0-9_-]{11}", video_url_or_id):
+    if _is_video_id(video_url_or_id):
         return video_url_or_id
 
+    # Common URL shapes resolve with one regex match; anything else goes through urlparse.
+    match = _RE_VIDEO_URL.match(video_url_or_id)
+    if match:
+        return match.group(1)
+
     parsed = urllib.parse.urlparse(video_url_or_id)
     host = (parsed.netloc or "").lower()
 
     if "youtu.be" in host:
         candidate = parsed.path.strip("/").split("/")[0]
-        return candidate if re.fullmatch(r"[A-Za-z0-9_-]{11}", candidate or "") else None
+        return candidate if _is_video_id(candidate) else None
 
     if "youtube.com" in host:
         if parsed.path.startswith("/watch"):
             candidate = urllib.parse.parse_qs(parsed.query).get("v", [None])[0]
-            return candidate if re.fullmatch(r"[A-Za-z0-9_-]{11}", candidate or "") else None
+            return candidate if _is_video_id(candidate) else None
 
         for prefix in ("/shorts/", "/embed/", "/live/"):
             if parsed.path.startswith(prefix):
                 candidate = parsed.path.replace(prefix, "").split("/")[0]
-                return candidate if re.fullmatch(r"[A-Za-z0-9_-]{11}", candidate or "") else None
+                return candidate if _is_video_id(candidate) else None
 
     return None
 
@@ -99,8 +242,12 @@ def extract_video_id(video_url_or_id):
 def parse_upload_date(upload_date):
     if not upload_date:
         return None
+    # Fixed YYYYMMDD layout: slicing avoids strptime's format/locale parsing.
+    text = str(upload_date)
+    if len(text) != 8 or not text.isdigit():
+        return None
     try:
-        return datetime.datetime.strptime(str(upload_date), "%Y%m%d")
+        return datetime.datetime(int(text[:4]), int(text[4:6]), int(text[6:]))
     except ValueError:
         return None
 
@@ -138,6 +285,15 @@ def format_duration(seconds):
         return "-"
 
 
+def _upload_date_from_timestamp(timestamp):
+    if not timestamp:
+        return None
+    try:
+        return datetime.datetime.fromtimestamp(int(timestamp), tz=datetime.timezone.utc).strftime("%Y%m%d")
+    except (TypeError, ValueError, OSError, OverflowError):
+        return None
+
+
 def _sort_timestamp(upload_date, timestamp):
     if timestamp:
         try:
@@ -153,48 +309,32 @@ def _sort_timestamp(upload_date, timestamp):
 
 
 def _clean_text(raw_text):
-    text = html.unescape(raw_text or "")
-    text = text.replace("\n", " ").replace("\r", " ")
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    if not raw_text:
+        return ""
+    return _RE_WS.sub(" ", html.unescape(raw_text)).strip()
+
+
+_NO_CAPTIONS_ERROR = "No subtitles or auto-captions were found for this video."
+_SNIPPET_TEXT = operator.attrgetter("text")
+# 1.x exposes instance fetch(); older releases only have the get_transcript classmethod.
+_TRANSCRIPT_API_HAS_FETCH = YouTubeTranscriptApi is not None and hasattr(YouTubeTranscriptApi, "fetch")
 
 
-def _join_segments(segments):
-    pieces = []
-    for segment in segments:
-        text = _clean_text(segment.get("text", ""))
-        if text:
-            pieces.append(text)
-    return " ".join(pieces).strip()
+def _join_texts(texts):
+    return " ".join(filter(None, map(_clean_text, texts)))
 
 
 def _transcript_from_api(video_id):
     if YouTubeTranscriptApi is None:
         raise RuntimeError("youtube-transcript-api is not installed.")
 
-    api = YouTubeTranscriptApi()
+    if _TRANSCRIPT_API_HAS_FETCH:
+        fetched = _thread_transcript_api().fetch(video_id, languages=PREFERRED_LANGUAGES)
+        # Snippets are homogeneous; read .text directly instead of building dicts via to_raw_data().
+        return _join_texts(map(_SNIPPET_TEXT, fetched)), getattr(fetched, "language_code", None)
 
-    if hasattr(api, "fetch"):
-        fetched = api.fetch(video_id, languages=PREFERRED_LANGUAGES)
-        if hasattr(fetched, "to_raw_data"):
-            raw_segments = fetched.to_raw_data()
-        else:
-            raw_segments = [
-                {
-                    "text": getattr(item, "text", ""),
-                    "start": getattr(item, "start", 0),
-                    "duration": getattr(item, "duration", 0),
-                }
-                for item in fetched
-            ]
-        return _join_segments(raw_segments), getattr(fetched, "language_code", None)
-
-    if hasattr(YouTubeTranscriptApi, "get_transcript"):
-        raw_segments = YouTubeTranscriptApi.get_transcript(video_id, languages=PREFERRED_LANGUAGES)
-        return _join_segments(raw_segments), None
-
-    raw_segments = api.get_transcript(video_id, languages=PREFERRED_LANGUAGES)
-    return _join_segments(raw_segments), None
+    raw_segments = YouTubeTranscriptApi.get_transcript(video_id, languages=PREFERRED_LANGUAGES)
+    return _join_texts(segment.get("text", "") for segment in raw_segments), None
 
 
 def _choose_caption_tracks(caption_dict):
@@ -212,15 +352,15 @@ def _choose_caption_tracks(caption_dict):
             ordered.append(track)
             seen.add(track_key)
 
-    for wanted in PREFERRED_LANGUAGES:
-        for key, tracks in caption_dict.items():
-            if key.lower() == wanted.lower():
-                for track in tracks:
-                    push(track)
+    tracks_by_language = {key.lower(): tracks for key, tracks in caption_dict.items()}
+
+    for wanted in _PREFERRED_LANGUAGES_LOWER:
+        for track in tracks_by_language.get(wanted, ()):
+            push(track)
 
-    for wanted in PREFERRED_LANGUAGES:
-        for key, tracks in caption_dict.items():
-            if key.lower().startswith(wanted.lower().split("-")[0]):
+    for prefix in _PREFERRED_LANGUAGE_PREFIXES:
+        for key, tracks in tracks_by_language.items():
+            if key.startswith(prefix):
                 for track in tracks:
                     push(track)
 
@@ -236,41 +376,215 @@ def _parse_caption_payload(payload, ext_hint):
     stripped_payload = payload.lstrip()
 
     if ext in {"json3", "srv3"} or stripped_payload.startswith("{"):
-        data = json.loads(payload)
-        events = data.get("events", [])
-        pieces = []
-        for event in events:
-            for seg in event.get("segs", []):
-                piece = _clean_text(seg.get("utf8", ""))
-                if piece:
-                    pieces.append(piece)
-        return " ".join(pieces).strip()
-
-    lines = []
+        data = _json_loads(payload)
+        # Clean once over the joined text instead of once per segment.
+        return _clean_text(
+            " ".join(
+                seg.get("utf8") or ""
+                for event in data.get("events") or ()
+                for seg in event.get("segs") or ()
+            )
+        )
+
+    kept = []
+    in_header = True
     for line in payload.splitlines():
         stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.startswith("WEBVTT"):
-            continue
         if "-->" in stripped:
+            in_header = False
             continue
-        if re.fullmatch(r"\d+", stripped):
+        if not stripped or stripped.isdigit() or (in_header and stripped.startswith(_VTT_HEADER_PREFIXES)):
             continue
-        lines.append(_clean_text(stripped))
-    return " ".join(lines).strip()
-
-
-def _transcript_from_ydlp(video_url):
-    ydl_opts = {
+        kept.append(stripped)
+    text = " ".join(kept)
+    if ext.startswith(_TAGGED_CAPTION_EXTS):
+        # Inline cue timing/styling tags are removed in one pass over the joined text.
+        text = _RE_MARKUP_TAG.sub("", text)
+    return _clean_text(text)
+
+
+_YDL_BASE_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "ignoreerrors": True,
+    "skip_download": True,
+    "socket_timeout": REQUEST_TIMEOUT_SECONDS,
+    "retries": 1,
+    "extractor_retries": 2,
+    "cachedir": YTDLP_CACHE_DIR,
+}
+_YDL_OPTS = {
+    "flat": {
+        **_YDL_BASE_OPTS,
+        "extract_flat": "in_playlist",
+        "extractor_args": {"youtubetab": {"approximate_date": ["timestamp"]}},
+        "playlist_items": f"1-{MAX_VIDEOS_PER_CHANNEL}",
+        "lazy_playlist": True,
+    },
+    "detail": dict(_YDL_BASE_OPTS),
+    "fallback": {
+        **_YDL_BASE_OPTS,
+        "playlist_items": f"1-{MAX_VIDEOS_PER_CHANNEL}",
+        "lazy_playlist": True,
+    },
+    "transcript": {
         "quiet": True,
         "no_warnings": True,
         "ignoreerrors": True,
         "skip_download": True,
-    }
+        "cachedir": YTDLP_CACHE_DIR,
+    },
+}
+
+# YoutubeDL instances are expensive to build and not safe to share between threads, so every
+# yt-dlp call runs on a cached pool whose workers keep their own instances. They hang off the
+# worker threads because Streamlit re-executes this module (and its globals) on every rerun.
+# Each worker also keeps a requests.Session so caption downloads and transcript API calls reuse
+# pooled connections.
+def _init_fetch_worker(open_clients):
+    worker = threading.current_thread()
+    worker.ydls = {}
+    worker.transcript_api = None
+    worker.http_session = requests.Session()
+    worker.open_clients = open_clients
+    open_clients.append(worker.http_session)
+
+
+def _close_clients(open_clients):
+    for client in open_clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+# YouTube blocks an IP for hours after a few hundred transcript requests in a short window, so
+# transcript and caption requests share one bucket. While a thread is inside prioritized() (the
+# selected video's load), every other caller waits, so background prefetches cannot hold up the
+# panel by taking the tokens first.
+class _TokenBucket:
+    def __init__(self, rate_per_second, capacity):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.priority_threads = set()
+        self.changed = threading.Condition()
+
+    @contextlib.contextmanager
+    def prioritized(self):
+        thread_id = threading.get_ident()
+        with self.changed:
+            self.priority_threads.add(thread_id)
+        try:
+            yield
+        finally:
+            with self.changed:
+                self.priority_threads.discard(thread_id)
+                self.changed.notify_all()
+
+    def acquire(self):
+        with self.changed:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                yielding = bool(self.priority_threads) and threading.get_ident() not in self.priority_threads
+                if self.tokens >= 1 and not yielding:
+                    self.tokens -= 1
+                    return
+                # Yielding callers are woken when the priority load ends; others when the next token is due.
+                self.changed.wait(None if yielding else (1 - self.tokens) / self.rate_per_second)
+
+
+@st.cache_resource
+def _fetch_executor():
+    open_clients = []
+    atexit.register(_close_clients, open_clients)
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=MAX_FETCH_WORKERS,
+        thread_name_prefix="yt-dlp",
+        initializer=_init_fetch_worker,
+        initargs=(open_clients,),
+    )
+
+
+@st.cache_resource
+def _transcript_bucket():
+    return _TokenBucket(TRANSCRIPT_REQUESTS_PER_MINUTE / 60, TRANSCRIPT_REQUEST_BURST)
+
+
+def _thread_ydl(name):
+    worker = threading.current_thread()
+    if name not in worker.ydls:
+        # YoutubeDL keeps and mutates its params dict, so each instance gets its own copy.
+        worker.ydls[name] = yt_dlp.YoutubeDL(copy.deepcopy(_YDL_OPTS[name]))
+        worker.open_clients.append(worker.ydls[name])
+    return worker.ydls[name]
+
+
+def _thread_transcript_api():
+    worker = threading.current_thread()
+    if worker.transcript_api is None:
+        worker.transcript_api = YouTubeTranscriptApi(http_client=worker.http_session)
+    return worker.transcript_api
+
+
+def _is_rate_limited(exc):
+    # youtube-transcript-api raises IpBlocked for HTTP 429. Its RequestBlocked parent also covers
+    # bot checks and cloud-IP bans, which retrying cannot fix, so only the subclass counts.
+    if isinstance(exc, IpBlocked):
+        return True
+    return isinstance(exc, requests.HTTPError) and exc.response is not None and exc.response.status_code == 429
+
+
+# Tokens and backoff are waited out on the calling thread, so pool workers (shared with channel
+# listings) are never parked while a transcript request is being paced.
+def _paced_call(fetch_executor, bucket, func, *args):
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        bucket.acquire()
+        try:
+            return fetch_executor.submit(func, *args).result()
+        except Exception as exc:
+            if attempt == RATE_LIMIT_ATTEMPTS - 1 or not _is_rate_limited(exc):
+                raise
+        time.sleep(min(RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt, RATE_LIMIT_MAX_BACKOFF_SECONDS))
+
 
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(video_url, download=False)
+def _extract_info(ydl_name, url):
+    return _thread_ydl(ydl_name).extract_info(url, download=False)
+
+
+def _run_parallel(func, items):
+    if not items:
+        return []
+    return list(_fetch_executor().map(func, items))
+
+
+def _get_caption_payload(url):
+    response = threading.current_thread().http_session.get(
+        url, timeout=(CONNECT_TIMEOUT_SECONDS, REQUEST_TIMEOUT_SECONDS)
+    )
+    response.raise_for_status()
+    return response.content.decode("utf-8", errors="ignore")
+
+
+def _download_caption_track(track, fetch_executor, bucket):
+    try:
+        payload = _paced_call(fetch_executor, bucket, _get_caption_payload, track["url"])
+    except requests.RequestException as exc:
+        _logger.warning("Caption download failed: %s", exc)
+        return None, f"Failed to download captions: {exc}"
+
+    try:
+        return _parse_caption_payload(payload, track.get("ext")), None
+    except (ValueError, TypeError, AttributeError) as exc:
+        _logger.warning("Caption parse failed (%s): %s", track.get("ext"), exc)
+        return None, f"Failed to parse captions: {exc}"
+
+
+def _transcript_from_ydlp(video_url, fetch_executor, bucket):
+    info = fetch_executor.submit(_extract_info, "transcript", video_url).result()
 
     if not info:
         return None, None, "yt-dlp could not load this video."
@@ -280,38 +594,92 @@ def _transcript_from_ydlp(video_url):
         ("manual subtitles", info.get("subtitles") or {}),
         ("auto captions", info.get("automatic_captions") or {}),
     ):
-        tracks = _choose_caption_tracks(caption_dict)
-        if not tracks:
-            continue
+        tracks = [track for track in _choose_caption_tracks(caption_dict) if track.get("url")]
 
+        # Tracks are tried one at a time in preference order: every download costs a rate-limit
+        # token, so speculative parallel downloads would spend the budget on unused tracks.
         for track in tracks:
-            caption_url = track.get("url")
-            ext_hint = track.get("ext")
-            if not caption_url:
-                continue
-
-            try:
-                with urllib.request.urlopen(caption_url, timeout=15) as response:
-                    payload = response.read().decode("utf-8", errors="ignore")
-                transcript_text = _parse_caption_payload(payload, ext_hint)
-                if transcript_text:
-                    return transcript_text, source_name, None
-            except Exception as exc:
-                last_error = f"Failed to download captions: {exc}"
+            transcript_text, error = _download_caption_track(track, fetch_executor, bucket)
+            if transcript_text:
+                return transcript_text, source_name, None
+            last_error = error or last_error
 
     if last_error:
         return None, None, last_error
 
-    return None, None, "No subtitles or auto-captions were found for this video."
+    return None, None, _NO_CAPTIONS_ERROR
 
 
-@st.cache_data(ttl=3600)
-def get_video_transcript(video_url, video_id):
-    if not video_id:
-        return {"ok": False, "error": "Could not parse a valid YouTube video id."}
+# Transcripts load in the background so the page stays interactive. Pending futures live in
+# session state, shared by bulk prefetches and the selected row.
+@st.cache_resource
+def _prefetch_executor():
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=TRANSCRIPT_BULK_WORKERS,
+        thread_name_prefix="transcripts",
+    )
+
 
+def prefetch_transcripts(videos):
+    # Transcript loads block on yt-dlp work queued to the fetch executor and on the shared rate-limit
+    # bucket, which are resolved here because cached resources should only be read from the script thread.
+    fetch_executor = _fetch_executor()
+    bucket = _transcript_bucket()
+    executor = _prefetch_executor()
+    futures = st.session_state.setdefault("transcript_futures", {})
+    for video in videos:
+        video_id = video.get("id")
+        # Videos loaded earlier are cheap to resubmit: successes and videos without captions are
+        # disk cache hits.
+        if video_id and video_id not in futures:
+            futures[video_id] = executor.submit(
+                _load_video_transcript, video["url"], video_id, fetch_executor, bucket
+            )
+
+
+def _prefetch_status(videos):
+    futures = st.session_state.get("transcript_futures", {})
+    statuses = st.session_state.setdefault("transcript_statuses", {})
+    # The selected video's future is left for the transcript panel to collect on the next run.
+    selected_id = _selected_video_id(st.session_state.get("selected_video") or {})
+    # Finished futures hold whole transcripts, so only whether they succeeded is kept.
+    for video_id, future in list(futures.items()):
+        if future.done() and video_id != selected_id:
+            del futures[video_id]
+            if not future.cancelled():
+                statuses[video_id] = future.exception() is None and future.result()["ok"]
+
+    ready = pending = total = 0
+    for video in videos:
+        video_id = video.get("id")
+        if video_id in futures:
+            total += 1
+            pending += 1
+        elif video_id in statuses:
+            total += 1
+            ready += statuses[video_id]
+    return ready, pending, total
+
+
+def _load_video_transcript(video_url, video_id, fetch_executor, bucket):
+    cache_key = f"tx:{video_id}"
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    transcript_data = _fetch_video_transcript(video_url, video_id, fetch_executor, bucket)
+    # Videos without captions are kept for a shorter time so they are not re-fetched on every
+    # prefetch. Rate limits and network errors are not cached and get retried on the next load.
+    if transcript_data["ok"]:
+        _disk_cache_set(cache_key, transcript_data, TRANSCRIPT_CACHE_TTL_SECONDS)
+    elif not transcript_data["retryable"]:
+        _disk_cache_set(cache_key, transcript_data, FAILED_TRANSCRIPT_CACHE_TTL_SECONDS)
+    return transcript_data
+
+
+def _fetch_video_transcript(video_url, video_id, fetch_executor, bucket):
     try:
-        transcript_text, language = _transcript_from_api(video_id)
+        transcript_text, language = _paced_call(fetch_executor, bucket, _transcript_from_api, video_id)
         if transcript_text:
             return {
                 "ok": True,
@@ -319,12 +687,22 @@ def get_video_transcript(video_url, video_id):
                 "source": "youtube-transcript-api",
                 "language": language or "auto",
             }
+    except (TranscriptsDisabled, NoTranscriptFound) as exc:
+        api_error = f"{type(exc).__name__}: no transcript in the preferred languages."
+    except RequestBlocked as exc:
+        api_error = f"{type(exc).__name__}: YouTube is blocking transcript requests from this IP."
+        _logger.warning("Transcript API blocked for %s: %s", video_id, api_error)
     except Exception as exc:
         api_error = f"{type(exc).__name__}: {exc}"
+        _logger.warning("Transcript API failed for %s: %s", video_id, api_error)
     else:
         api_error = "youtube-transcript-api returned an empty transcript."
 
-    transcript_text, source_name, fallback_error = _transcript_from_ydlp(video_url)
+    try:
+        transcript_text, source_name, fallback_error = _transcript_from_ydlp(video_url, fetch_executor, bucket)
+    except Exception as exc:
+        _logger.exception("yt-dlp transcript fallback failed for %s", video_id)
+        transcript_text, source_name, fallback_error = None, None, f"{type(exc).__name__}: {exc}"
     if transcript_text:
         return {
             "ok": True,
@@ -336,199 +714,346 @@ def get_video_transcript(video_url, video_id):
     return {
         "ok": False,
         "error": f"Transcript failed. API error: {api_error}. Fallback error: {fallback_error}",
+        # yt-dlp loaded the video and found no caption tracks, so retrying will not help.
+        "retryable": fallback_error != _NO_CAPTIONS_ERROR,
     }
 
 
+# Streamlit reruns the whole script on every interaction; skip re-scoring the same transcript.
+@st.cache_data(ttl=3600, show_spinner=False)
 def summarize_transcript(transcript_text, max_points=5):
-    sentences = re.split(r"(?<=[.!?])\s+", transcript_text)
-    sentences = [sentence.strip() for sentence in sentences if sentence.strip()]
+    sentences = []
+    # Auto-captions repeat rolling-window lines; a fixed-size prefix key drops the copies cheaply.
+    seen_prefixes = set()
+    for sentence in map(str.strip, _RE_SENT.split(transcript_text)):
+        if not sentence:
+            continue
+        prefix_key = hash(sentence[:_SUMMARY_DEDUPE_PREFIX].casefold())
+        if prefix_key in seen_prefixes:
+            continue
+        seen_prefixes.add(prefix_key)
+        sentences.append(sentence)
 
     if len(sentences) <= max_points:
-        return sentences
+        return tuple(sentences)
 
-    stop_words = {
-        "the", "and", "that", "this", "with", "from", "have", "were", "what", "about", "would", "there",
-        "para", "com", "uma", "que", "por", "isso", "como", "mais", "muito", "sobre", "entre", "tambem",
-    }
+    sentence_tokens = [_RE_WORD.findall(sentence.lower()) for sentence in sentences]
 
-    frequencies = {}
-    for sentence in sentences:
-        for token in re.findall(r"[A-Za-zÀ-ÿ0-9']+", sentence.lower()):
-            if len(token) < 3 or token in stop_words:
-                continue
-            frequencies[token] = frequencies.get(token, 0) + 1
+    frequencies = collections.Counter(
+        token
+        for tokens in sentence_tokens
+        for token in tokens
+        if len(token) >= 3 and token not in _STOP_WORDS
+    )
 
     if not frequencies:
-        return sentences[:max_points]
+        return tuple(sentences[:max_points])
 
     scored = []
-    for index, sentence in enumerate(sentences):
-        tokens = re.findall(r"[A-Za-zÀ-ÿ0-9']+", sentence.lower())
+    for index, (sentence, tokens) in enumerate(zip(sentences, sentence_tokens)):
         if not tokens:
             continue
-        score = sum(frequencies.get(token, 0) for token in tokens) / (len(tokens) ** 0.5)
+        norm = len(tokens) ** 0.5
+        score = sum(map(frequencies.get, tokens, itertools.repeat(0))) / norm
         scored.append((score, index, sentence))
 
-    top = sorted(scored, key=lambda item: item[0], reverse=True)[:max_points]
+    top = heapq.nlargest(max_points, scored, key=lambda item: item[0])
     top = sorted(top, key=lambda item: item[1])
-    return [item[2] for item in top]
+    return tuple(item[2] for item in top)
 
 
 def build_prompt(video_url, summary_points, transcript_text):
-    summary_block = "\n".join(f"- {point}" for point in summary_points)
-    clipped_transcript = transcript_text[:8000]
-    return (
-        f"Resuma e destaque os principais pontos do video: {video_url}\n\n"
-        f"Resumo inicial:\n{summary_block}\n\n"
-        f"Transcricao (recorte):\n{clipped_transcript}"
+    return "".join(
+        (
+            "Resuma e destaque os principais pontos do video: ",
+            video_url,
+            "\n\nResumo inicial:\n",
+            "\n".join(f"- {point}" for point in summary_points),
+            "\n\nTranscricao (recorte):\n",
+            transcript_text[:8000],
+        )
+    )
+
+
+def _channel_videos_url(channel_url):
+    clean_url = channel_url.rstrip("/")
+    if not clean_url.endswith("/videos"):
+        clean_url += "/videos"
+    return clean_url
+
+
+def _fetch_channel(channel_url, ydl_name, error_label):
+    clean_url = _channel_videos_url(channel_url)
+    try:
+        info = _extract_info(ydl_name, clean_url)
+        # With ignoreerrors, yt-dlp reports download errors as a None result instead of raising.
+        if not info:
+            _logger.warning("%s: %s", error_label, clean_url)
+            return [], f"{error_label}: {clean_url}"
+        entries = [entry for entry in info.get("entries") or [] if entry]
+    except Exception as exc:
+        # An extractor bug in one channel should not take down the whole category.
+        _logger.exception("%s: %s", error_label, clean_url)
+        return [], f"{error_label}: {clean_url} ({type(exc).__name__})"
+
+    channel_title = info.get("channel") or info.get("title") or clean_url.split("@")[-1]
+    videos = []
+    for entry in entries:
+        video_id = entry.get("id") or extract_video_id(entry.get("url"))
+        if video_id:
+            videos.append(_video_from_entry(video_id, channel_title, entry))
+    return videos, None
+
+
+def _fetch_video_detail(video_url):
+    try:
+        return _extract_info("detail", video_url)
+    except Exception:
+        _logger.exception("Video detail failed: %s", video_url)
+        return None
+
+
+def _video_from_entry(video_id, channel_title, entry):
+    timestamp = entry.get("timestamp")
+    upload_date = entry.get("upload_date") or _upload_date_from_timestamp(timestamp)
+    return {
+        "id": video_id,
+        "channel": channel_title,
+        "title": entry.get("title") or "Untitled",
+        "url": entry.get("webpage_url") or f"https://www.youtube.com/watch?v={video_id}",
+        "views": entry.get("view_count"),
+        "duration": entry.get("duration"),
+        "upload_date": upload_date,
+        "timestamp": timestamp,
+        "sort_ts": _sort_timestamp(upload_date, timestamp),
+    }
+
+
+def _needs_detail(video):
+    return video["title"] == "Untitled" or None in (
+        video["upload_date"],
+        video["timestamp"],
+        video["views"],
+        video["duration"],
     )
 
 
+def _merge_video_detail(video, detail):
+    video["upload_date"] = video["upload_date"] or detail.get("upload_date")
+    video["timestamp"] = video["timestamp"] or detail.get("timestamp")
+    if video["views"] is None:
+        video["views"] = detail.get("view_count")
+    video["duration"] = video["duration"] or detail.get("duration")
+    if video["title"] == "Untitled":
+        video["title"] = detail.get("title") or video["title"]
+    video["sort_ts"] = _sort_timestamp(video["upload_date"], video["timestamp"])
+
+
+def _collect_channel_videos(channel_results, errors):
+    videos = []
+    seen_video_ids = set()
+    for channel_videos, error in channel_results:
+        if error:
+            errors.append(error)
+            continue
+
+        for video in channel_videos:
+            if video["id"] in seen_video_ids:
+                continue
+            seen_video_ids.add(video["id"])
+            videos.append(video)
+    return videos
+
+
+def _add_display_fields(videos):
+    for video in videos:
+        video["date_fmt"] = format_date(video.get("upload_date"), video.get("timestamp"))
+        video["views_fmt"] = format_views(video.get("views"))
+        video["duration_fmt"] = format_duration(video.get("duration"))
+    return videos
+
+
+# Display strings are formatted once per cache fill, so reruns only read them back.
 @st.cache_data(ttl=1800)
 def get_channel_data(category_name):
-    channels = CATEGORIES[category_name]
-    all_videos = []
-    errors = []
-    seen_video_ids = set()
+    all_videos, errors, stale_channels = _fetch_category_videos(category_name)
+    return _add_display_fields(all_videos), errors, stale_channels
 
-    flat_opts = {
-        "extract_flat": True,
-        "playlist_items": f"1-{MAX_VIDEOS_PER_CHANNEL}",
-        "lazy_playlist": True,
-        "quiet": True,
-        "no_warnings": True,
-        "ignoreerrors": True,
-        "skip_download": True,
-        "socket_timeout": REQUEST_TIMEOUT_SECONDS,
-        "retries": 1,
-    }
-    detail_opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "ignoreerrors": True,
-        "skip_download": True,
-        "socket_timeout": REQUEST_TIMEOUT_SECONDS,
-        "retries": 1,
-    }
 
-    with yt_dlp.YoutubeDL(flat_opts) as flat_ydl, yt_dlp.YoutubeDL(detail_opts) as detail_ydl:
-        for channel_url in channels:
-            clean_url = channel_url.rstrip("/")
-            if not clean_url.endswith("/videos"):
-                clean_url += "/videos"
-
-            try:
-                info = flat_ydl.extract_info(clean_url, download=False)
-                if not info:
-                    errors.append(f"Channel failed: {clean_url}")
-                    continue
-
-                entries = info.get("entries") or []
-                channel_title = info.get("channel") or info.get("title") or clean_url.split("@")[-1]
-
-                for entry in entries:
-                    if not entry:
-                        continue
-
-                    video_id = entry.get("id") or extract_video_id(entry.get("url"))
-                    if not video_id or video_id in seen_video_ids:
-                        continue
-
-                    video_url = entry.get("webpage_url") or f"https://www.youtube.com/watch?v={video_id}"
-                    upload_date = entry.get("upload_date")
-                    timestamp = entry.get("timestamp")
-                    views = entry.get("view_count")
-                    duration = entry.get("duration")
-                    title = entry.get("title") or "Untitled"
-
-                    try:
-                        detail = detail_ydl.extract_info(video_url, download=False)
-                    except Exception:
-                        detail = None
-                    if detail:
-                        upload_date = upload_date or detail.get("upload_date")
-                        timestamp = timestamp or detail.get("timestamp")
-                        views = views if views is not None else detail.get("view_count")
-                        duration = duration or detail.get("duration")
-                        if title == "Untitled":
-                            title = detail.get("title") or title
-
-                    seen_video_ids.add(video_id)
-                    all_videos.append(
-                        {
-                            "id": video_id,
-                            "channel": channel_title,
-                            "title": title,
-                            "url": video_url,
-                            "views": views,
-                            "duration": duration,
-                            "upload_date": upload_date,
-                            "timestamp": timestamp,
-                            "sort_ts": _sort_timestamp(upload_date, timestamp),
-                        }
-                    )
-            except Exception as exc:
-                errors.append(f"Channel failed: {clean_url} ({type(exc).__name__})")
+def _channel_cache_key(channel_url):
+    return f"ch:{_channel_videos_url(channel_url)}"
+
+
+def _crawl_channels(channel_urls, executor):
+    channel_futures = {
+        executor.submit(_fetch_channel, channel_url, "flat", "Channel failed"): channel_url
+        for channel_url in channel_urls
+    }
+    # Queue detail lookups as soon as each listing arrives instead of waiting for the slowest channel.
+    detail_futures = {}
+    for future in concurrent.futures.as_completed(channel_futures):
+        channel_videos, _ = future.result()
+        for video in channel_videos:
+            if _needs_detail(video) and video["id"] not in detail_futures:
+                detail_futures[video["id"]] = executor.submit(_fetch_video_detail, video["url"])
+
+    channel_results = {}
+    for future, channel_url in channel_futures.items():
+        channel_videos, error = future.result()
+        for video in channel_videos:
+            detail_future = detail_futures.get(video["id"])
+            detail = detail_future.result() if detail_future else None
+            if detail:
+                _merge_video_detail(video, detail)
+        if channel_videos:
+            _disk_cache_set(_channel_cache_key(channel_url), channel_videos, CHANNEL_CACHE_TTL_SECONDS)
+        channel_results[channel_url] = (channel_videos, error)
+    return channel_results
+
+
+def _fetch_category_videos(category_name):
+    channels = CATEGORIES[category_name]
+    errors = []
+    executor = _fetch_executor()
+
+    # Listings are cached per channel, so an expired or failing channel only re-crawls itself.
+    # Expired listings are still served and reported back as stale for a background refresh.
+    channel_results = {}
+    stale_channels = []
+    for channel_url in channels:
+        cached, is_stale = _disk_cache_get_stale(_channel_cache_key(channel_url))
+        if cached is not None:
+            channel_results[channel_url] = (cached, None)
+            if is_stale:
+                stale_channels.append(channel_url)
+
+    missing_channels = [channel_url for channel_url in channels if channel_url not in channel_results]
+    channel_results.update(_crawl_channels(missing_channels, executor))
+    all_videos = _collect_channel_videos([channel_results[channel_url] for channel_url in channels], errors)
 
     # Full extraction fallback when all channels returned empty.
     if not all_videos:
-        fallback_opts = {
-            "playlist_items": f"1-{MAX_VIDEOS_PER_CHANNEL}",
-            "lazy_playlist": True,
-            "quiet": True,
-            "no_warnings": True,
-            "ignoreerrors": True,
-            "skip_download": True,
-            "socket_timeout": REQUEST_TIMEOUT_SECONDS,
-            "retries": 1,
-        }
-        with yt_dlp.YoutubeDL(fallback_opts) as ydl:
-            for channel_url in channels:
-                clean_url = channel_url.rstrip("/")
-                if not clean_url.endswith("/videos"):
-                    clean_url += "/videos"
-
-                try:
-                    info = ydl.extract_info(clean_url, download=False)
-                    entries = info.get("entries") or []
-                    channel_title = info.get("channel") or info.get("title") or clean_url.split("@")[-1]
-                    for entry in entries:
-                        if not entry:
-                            continue
-                        video_id = entry.get("id") or extract_video_id(entry.get("url"))
-                        if not video_id or video_id in seen_video_ids:
-                            continue
-                        seen_video_ids.add(video_id)
-                        all_videos.append(
-                            {
-                                "id": video_id,
-                                "channel": channel_title,
-                                "title": entry.get("title") or "Untitled",
-                                "url": entry.get("webpage_url") or f"https://www.youtube.com/watch?v={video_id}",
-                                "views": entry.get("view_count"),
-                                "duration": entry.get("duration"),
-                                "upload_date": entry.get("upload_date"),
-                                "timestamp": entry.get("timestamp"),
-                                "sort_ts": _sort_timestamp(entry.get("upload_date"), entry.get("timestamp")),
-                            }
-                        )
-                except Exception as exc:
-                    errors.append(f"Fallback failed: {clean_url} ({type(exc).__name__})")
+        fallback_results = _run_parallel(
+            functools.partial(_fetch_channel, ydl_name="fallback", error_label="Fallback failed"),
+            channels,
+        )
+        for channel_url, (channel_videos, _) in zip(channels, fallback_results):
+            if channel_videos:
+                _disk_cache_set(_channel_cache_key(channel_url), channel_videos, CHANNEL_CACHE_TTL_SECONDS)
+        all_videos = _collect_channel_videos(fallback_results, errors)
 
     all_videos.sort(key=lambda item: item.get("sort_ts", 0), reverse=True)
-    return all_videos, errors
+    return all_videos, errors, stale_channels
+
+
+# A single worker queues refreshes instead of several sessions crawling the same channels at once.
+@st.cache_resource
+def _refresh_executor():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="channel-refresh")
+
+
+def _refresh_stale_channels(channel_urls, fetch_executor):
+    # Another session may have refreshed some of these while this job was queued.
+    still_stale = [
+        channel_url for channel_url in channel_urls if _disk_cache_get(_channel_cache_key(channel_url)) is None
+    ]
+    for channel_url, (channel_videos, _) in _crawl_channels(still_stale, fetch_executor).items():
+        if channel_videos:
+            continue
+        # Keep serving the old listing for a while rather than re-crawling a failing channel on every rerun.
+        cache_key = _channel_cache_key(channel_url)
+        cached, _ = _disk_cache_get_stale(cache_key)
+        if cached is not None:
+            _disk_cache_set(cache_key, cached, STALE_CHANNEL_RETRY_SECONDS)
+
+
+def select_video_row(table_key, videos):
+    selected_rows = st.session_state[table_key].selection.rows
+    if selected_rows:
+        st.session_state["selected_video"] = videos[selected_rows[0]]
+
+
+def _selected_video_id(video):
+    return video.get("id") or extract_video_id(video.get("url"))
+
+
+def _load_selected_transcript(video_url, video_id, fetch_executor, bucket):
+    # The panel load jumps ahead of any background prefetch still waiting for a token.
+    with bucket.prioritized():
+        return _load_video_transcript(video_url, video_id, fetch_executor, bucket)
+
+
+def _submit_selected_transcript(video_url, video_id, futures):
+    fetch_executor = _fetch_executor()
+    bucket = _transcript_bucket()
+    executor = _prefetch_executor()
+    # Prefetches that have not started are moved behind the selected video instead of ahead of it.
+    requeued = [other_id for other_id, future in futures.items() if other_id != video_id and future.cancel()]
+    futures[video_id] = executor.submit(_load_selected_transcript, video_url, video_id, fetch_executor, bucket)
+    for other_id in requeued:
+        futures[other_id] = executor.submit(
+            _load_video_transcript, f"https://www.youtube.com/watch?v={other_id}", other_id, fetch_executor, bucket
+        )
+    return futures[video_id]
+
+
+def _selected_transcript(video_url, video_id):
+    if not video_id:
+        return {"ok": False, "error": "Could not parse a valid YouTube video id."}
+
+    loaded = st.session_state.get("selected_transcript")
+    if loaded is not None and loaded[0] == video_id:
+        return loaded[1]
+
+    futures = st.session_state.setdefault("transcript_futures", {})
+    future = futures.get(video_id)
+    if future is None:
+        transcript_data = _disk_cache_get(f"tx:{video_id}")
+        if transcript_data is None:
+            future = _submit_selected_transcript(video_url, video_id, futures)
+    elif future.cancel():
+        future = _submit_selected_transcript(video_url, video_id, futures)
+
+    if future is not None:
+        if not future.done():
+            return None
+        del futures[video_id]
+        try:
+            transcript_data = future.result()
+        except Exception as exc:
+            _logger.exception("Transcript load failed for %s", video_id)
+            transcript_data = {"ok": False, "error": f"{type(exc).__name__}: {exc}", "retryable": True}
+
+    st.session_state["selected_transcript"] = (video_id, transcript_data)
+    return transcript_data
+
+
+# Polls the pending load and reruns the whole page once it finishes, so the panel swaps in.
+@st.fragment(run_every=1)
+def _transcript_placeholder(video_id):
+    future = st.session_state.get("transcript_futures", {}).get(video_id)
+    if future is None or future.done():
+        st.rerun()
+    st.info("Loading transcript...")
 
 
 def render_transcript_panel(video):
-    video_id = video.get("id") or extract_video_id(video.get("url"))
-    transcript_data = get_video_transcript(video.get("url"), video_id)
+    video_id = _selected_video_id(video)
 
     st.subheader("Transcript")
     st.caption(f"Selected video: {video.get('title')}")
     st.markdown(f"[Open on YouTube]({video.get('url')})")
 
+    transcript_data = _selected_transcript(video.get("url"), video_id)
+    if transcript_data is None:
+        _transcript_placeholder(video_id)
+        return
+
     if not transcript_data["ok"]:
         st.error(transcript_data["error"])
+        if transcript_data.get("retryable") and st.button("Retry Transcript", use_container_width=True):
+            st.session_state.pop("selected_transcript", None)
+            st.rerun()
         return
 
     transcript_text = transcript_data["text"]
@@ -570,7 +1095,7 @@ with st.sidebar:
     st.title("Menu")
     selected_category = st.radio("Category:", list(CATEGORIES.keys()))
     if st.button("Refresh Data", use_container_width=True):
-        st.cache_data.clear()
+        clear_caches()
         st.rerun()
 
 # --- MAIN CONTENT ---
@@ -585,8 +1110,22 @@ if st.button("Fetch Transcript From URL", use_container_width=True):
         "url": manual_url,
     }
 
+channel_refreshes = st.session_state.setdefault("channel_refreshes", {})
+refresh_future = channel_refreshes.get(selected_category)
+if refresh_future is not None and refresh_future.done():
+    del channel_refreshes[selected_category]
+    get_channel_data.clear(selected_category)
+
 with st.spinner("Loading channels..."):
-    videos, fetch_errors = get_channel_data(selected_category)
+    videos, fetch_errors, stale_channels = get_channel_data(selected_category)
+
+# Stale listings render right away; the refreshed ones are picked up on a later rerun.
+if stale_channels and selected_category not in channel_refreshes:
+    channel_refreshes[selected_category] = _refresh_executor().submit(
+        _refresh_stale_channels, stale_channels, _fetch_executor()
+    )
+if selected_category in channel_refreshes:
+    st.caption(f"Refreshing {len(stale_channels)} channel(s) in the background.")
 
 if fetch_errors:
     with st.expander("Channel loading issues"):
@@ -601,32 +1140,40 @@ if selected_video and selected_video.get("url"):
 if not videos:
     st.error("No videos found for this category.")
     if st.button("Retry Channel Fetch", use_container_width=True):
-        st.cache_data.clear()
+        clear_caches()
         st.rerun()
     if fetch_errors:
         st.warning("Some channels returned errors. See details below.")
         for issue in fetch_errors[:8]:
             st.write(f"- {issue}")
 else:
-    cols = st.columns([2, 1.2, 4.8, 1, 1, 1])
-    cols[0].markdown("**Channel**")
-    cols[1].markdown("**Summary**")
-    cols[2].markdown("**Video Title**")
-    cols[3].markdown("**Date**")
-    cols[4].markdown("**Views**")
-    cols[5].markdown("**Length**")
-    st.markdown("---")
-
-    for video in videos:
-        c1, c2, c3, c4, c5, c6 = st.columns([2, 1.2, 4.8, 1, 1, 1])
-        c1.write(video["channel"])
-
-        if c2.button("Summary", key=f"summary_{video['id']}", use_container_width=True):
-            st.session_state["selected_video"] = video
-            st.rerun()
-
-        c3.markdown(f"[{video['title']}]({video['url']})")
-        c4.write(format_date(video.get("upload_date"), video.get("timestamp")))
-        c5.write(format_views(video.get("views")))
-        c6.write(format_duration(video.get("duration")))
-        st.divider()
+    if st.button("Prefetch All Transcripts", use_container_width=True):
+        prefetch_transcripts(videos)
+    ready_count, pending_count, prefetch_total = _prefetch_status(videos)
+    if prefetch_total:
+        status = f"Transcripts ready for {ready_count} of {prefetch_total} videos."
+        if pending_count:
+            status += f" {pending_count} still loading."
+        st.caption(status)
+
+    table_key = f"videos_{selected_category}"
+    st.caption("Select a row to load its transcript and summary.")
+    st.dataframe(
+        [
+            {
+                "Channel": video["channel"],
+                "Video Title": video["title"],
+                "Date": video["date_fmt"],
+                "Views": video["views_fmt"],
+                "Length": video["duration_fmt"],
+                "Link": video["url"],
+            }
+            for video in videos
+        ],
+        key=table_key,
+        on_select=functools.partial(select_video_row, table_key, videos),
+        selection_mode="single-row",
+        hide_index=True,
+        use_container_width=True,
+        column_config={"Link": st.column_config.LinkColumn("Link", display_text="Open")},
+    )